@@ -13,6 +13,7 @@ Usage:
   python3 em_dogwhistle.py --programme scan   # Frequency scanning mode
 """
 
+import math
 import numpy as np
 from scipy.io import wavfile
 import argparse
@@ -25,6 +26,27 @@ import signal
 
 SAMPLE_RATE = 44100
 RF_SAMPLE_RATE = 2000000  # 2 MHz for HackRF
+PLAYER_HEALTHY_SECONDS = 60  # an aplay run this long resets the restart backoff
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional — NumPy path in MechanicalChannel._mix
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mix_sines_k(freqs, weights, n, sr, out):
+        """out[i] = sum of weights[k] * sin(2*pi*freqs[k]*t), every layer per sample."""
+        inv_sr = 1.0 / sr
+        for i in prange(n):
+            t = i * inv_sr
+            acc = 0.0
+            for k in range(freqs.shape[0]):
+                acc += weights[k] * math.sin(2.0 * math.pi * freqs[k] * t)
+            out[i] = acc
+        return out
+else:
+    _mix_sines_k = None
 
 
 class MechanicalChannel:
@@ -33,32 +55,52 @@ class MechanicalChannel:
     def __init__(self, sample_rate=SAMPLE_RATE):
         self.sr = sample_rate
 
+    def _time_axis(self, duration):
+        """Sample times for duration seconds (arange * dt, no per-sample divide)."""
+        return np.arange(int(self.sr * duration)) * (1.0 / self.sr)
+
+    def _sine(self, freq, t):
+        """sin(2*pi*freq*t), computed in place in one buffer."""
+        out = (2 * np.pi * freq) * t
+        return np.sin(out, out=out)
+
+    def _mix(self, duration, freqs, weights):
+        """Weighted sum of sines; one parallel pass over the samples with numba."""
+        n = int(self.sr * duration)
+        if _mix_sines_k is not None:
+            return _mix_sines_k(np.asarray(freqs, dtype=np.float64),
+                                np.asarray(weights, dtype=np.float64),
+                                n, float(self.sr), np.empty(n))
+        t = self._time_axis(duration)
+        out = np.zeros(n)
+        for freq, weight in zip(freqs, weights):
+            out += weight * self._sine(freq, t)
+        return out
+
     def schumann_fundamental(self, duration):
         """7.83 Hz — Earth's fundamental Schumann resonance."""
-        t = np.linspace(0, duration, int(self.sr * duration), endpoint=False)
-        return np.sin(2 * np.pi * 7.83 * t)
+        return self._mix(duration, (7.83,), (1.0,))
 
     def schumann_second(self, duration):
         """14.3 Hz — Second Schumann harmonic."""
-        t = np.linspace(0, duration, int(self.sr * duration), endpoint=False)
-        return np.sin(2 * np.pi * 14.3 * t)
+        return self._mix(duration, (14.3,), (1.0,))
 
     def schumann_combined(self, duration):
         """7.83 Hz + 14.3 Hz combined."""
-        return 0.7 * self.schumann_fundamental(duration) + 0.3 * self.schumann_second(duration)
+        return self._mix(duration, (7.83, 14.3), (0.7, 0.3))
 
     def infrasound_chirp(self, duration, f_start=1.0, f_end=20.0):
         """Sweep from f_start to f_end Hz."""
-        t = np.linspace(0, duration, int(self.sr * duration), endpoint=False)
+        t = self._time_axis(duration)
         freq = f_start + (f_end - f_start) * (t / duration)
         phase = 2 * np.pi * np.cumsum(freq) / self.sr
         return np.sin(phase)
 
     def breathing_pattern(self, duration, base_freq=7.83, breath_rate=0.25):
         """Base frequency with breathing amplitude modulation."""
-        t = np.linspace(0, duration, int(self.sr * duration), endpoint=False)
-        carrier = np.sin(2 * np.pi * base_freq * t)
-        breath = 0.5 * (1 + np.sin(2 * np.pi * breath_rate * t)) ** 2
+        t = self._time_axis(duration)
+        carrier = self._mix(duration, (base_freq,), (1.0,))
+        breath = 0.5 * (1 + self._sine(breath_rate, t)) ** 2
         return carrier * breath
 
     def generate_programme(self, programme, duration):
@@ -78,21 +120,24 @@ class MechanicalChannel:
         else:
             signal_data = self.schumann_fundamental(duration)
 
-        # Normalise
-        max_val = np.max(np.abs(signal_data))
+        # Normalise in place: the programme array is ours, and the peak
+        # comes from two reductions rather than an abs() copy
+        max_val = max(signal_data.max(), -signal_data.min())
         if max_val > 0:
-            signal_data = signal_data / max_val * 0.9
+            signal_data /= max_val
+            signal_data *= 0.9
 
-        return np.int16(signal_data * 32767)
+        signal_data *= 32767
+        return signal_data.astype(np.int16)
 
     def _scan_programme(self, duration):
         """Scan through Schumann harmonics: 7.83, 14.3, 20.8, 27.3, 33.8 Hz."""
         freqs = [7.83, 14.3, 20.8, 27.3, 33.8]
         segment_dur = duration / len(freqs)
         segments = []
-        t = np.linspace(0, segment_dur, int(self.sr * segment_dur), endpoint=False)
+        t = self._time_axis(segment_dur)
         for freq in freqs:
-            segments.append(np.sin(2 * np.pi * freq * t))
+            segments.append(self._sine(freq, t))
         return np.concatenate(segments)
 
     def _full_programme(self, duration):
@@ -138,12 +183,11 @@ class RFChannel:
     def generate_baseband(self, duration, mod_freq=7.83, mod_type="am"):
         """Generate baseband IQ samples with modulation."""
         n_samples = int(self.sr * duration)
-        t = np.linspace(0, duration, n_samples, endpoint=False)
+        t = np.arange(n_samples) * (1.0 / self.sr)
 
         if mod_type == "am":
             # AM modulation: carrier modulated by low frequency
-            modulator = 0.5 * (1 + np.sin(2 * np.pi * mod_freq * t))
-            i = modulator * np.ones(n_samples)
+            i = 0.5 * (1 + np.sin(2 * np.pi * mod_freq * t))
             q = np.zeros(n_samples)
         elif mod_type == "pulse":
             # Pulsed: 1s on, 1s off
@@ -182,7 +226,11 @@ class RFChannel:
         """Stop transmission."""
         if self.process:
             self.process.terminate()
-            self.process.wait(timeout=5)
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
             self.process = None
 
 
@@ -193,6 +241,7 @@ class ElectromechanicalController:
         self.args = args
         self.mech = MechanicalChannel()
         self.rf = RFChannel(carrier_freq=args.freq) if args.rf else None
+        self.mech_proc = None
         self.running = True
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
@@ -200,9 +249,64 @@ class ElectromechanicalController:
     def _handle_signal(self, signum, frame):
         print("\nShutting down...")
         self.running = False
+        self._stop_mechanical()
         if self.rf:
             self.rf.stop()
 
+    def _play_mechanical_loop(self, pcm):
+        """
+        Loop int16 PCM through one long-running aplay reading raw audio on
+        stdin, so the device stays open with no gap or re-spawn per pass.
+        aplay is only restarted (with backoff) if it dies.
+        
+        Only this thread touches aplay's stdin: _stop_mechanical just ends
+        the process, which breaks the pipe under any blocked write here.
+        """
+        cmd = ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-c", "1",
+               "-r", str(SAMPLE_RATE), "-"]
+        block = SAMPLE_RATE  # ~1 s per write, so a stop is noticed quickly
+        backoff = 1
+        while self.running:
+            proc = None
+            started = time.monotonic()
+            try:
+                proc = self.mech_proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                while self.running:
+                    for i in range(0, len(pcm), block):
+                        if not self.running:
+                            break
+                        proc.stdin.write(pcm[i:i + block])
+            except (BrokenPipeError, ValueError):
+                pass  # aplay exited, or was stopped by _stop_mechanical
+            except Exception as e:
+                print(f"  Mechanical error: {e}")
+                break
+            finally:
+                if proc is not None:
+                    self._stop_mechanical()
+                    try:
+                        proc.stdin.close()
+                    except (OSError, ValueError):
+                        pass  # unflushed audio to a dead player
+            if self.running:
+                if time.monotonic() - started >= PLAYER_HEALTHY_SECONDS:
+                    backoff = 1  # it had been playing fine; retry promptly
+                print(f"  Mechanical player exited; restarting in {backoff}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _stop_mechanical(self):
+        """Stop the mechanical player process, if running."""
+        proc, self.mech_proc = self.mech_proc, None
+        if proc is None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
     def run(self):
         duration = self.args.duration
         programme = self.args.programme
@@ -248,17 +352,8 @@ class ElectromechanicalController:
         threads = []
 
         # Mechanical thread
-        def play_mechanical():
-            while self.running:
-                try:
-                    subprocess.run(["aplay", mech_file], timeout=duration + 10)
-                except subprocess.TimeoutExpired:
-                    pass
-                except Exception as e:
-                    print(f"  Mechanical error: {e}")
-                    break
-
-        t_mech = threading.Thread(target=play_mechanical, daemon=True)
+        t_mech = threading.Thread(target=self._play_mechanical_loop,
+                                  args=(mech_data,), daemon=True)
         t_mech.start()
         threads.append(t_mech)
         print("  ✓ Mechanical channel active (ground coupling)")
@@ -286,6 +381,7 @@ class ElectromechanicalController:
         # Cleanup
         print("\n\n■ Stopping...")
         self.running = False
+        self._stop_mechanical()
         if self.rf:
             self.rf.stop()
             print("  ✓ RF stopped")
@@ -0,0 +1,35 @@
+"""
+JSON encoding for logs and session summaries.
+Uses orjson when installed, stdlib json otherwise; both produce UTF-8 bytes.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to the stdlib
+    orjson = None
+
+
+def _default(obj):
+    """Serialise numpy arrays and scalars for the stdlib encoder."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_line(obj):
+    """One compact JSON record plus newline, as bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj, separators=(',', ':'), default=_default) + '\n').encode()
+
+
+def dumps_pretty(obj):
+    """Two-space indented JSON, as bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=_default).encode()
+
+
+loads = orjson.loads if orjson is not None else json.loads
@@ -3,13 +3,25 @@ HydrogenLineBeacon — Main entry point.
 High-level API for the complete beacon system.
 """
 
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from .protocol import ProtocolController
 from .rf import RFChannel
 from .mechanical import MechanicalChannel
 from .monitor import Monitor
+from . import waveforms
 from .constants import HYDROGEN_LINE_HZ, ISM_BANDS
 
 
+def _aplay_available():
+    """Check if ALSA aplay is installed."""
+    try:
+        subprocess.run(["aplay", "--version"], capture_output=True, timeout=3)
+        return True
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
 class HydrogenLineBeacon:
     """
     Hydrogen Line Beacon — dual-channel electromechanical signal system.
@@ -90,6 +102,21 @@ class HydrogenLineBeacon:
         print(f"Generated {filename}")
         return filename
     
+    def precompile(self):
+        """
+        Compile the numba kernels into their on-disk cache now (e.g. at
+        install time), not on the first WAV or probe the service generates:
+        every waveform kernel signature, then the RF baseband paths.
+        """
+        if not waveforms.precompile():
+            print("numba not installed — nothing to compile.")
+            return False
+        rf = RFChannel(carrier_freq=self.config['rf_carrier'])
+        for modulation in ('schumann', 'single', 'cw'):
+            rf.generate_baseband(0.001, modulation, pulsed=True)
+        print("Kernels compiled and cached.")
+        return True
+    
     def scan_baseline(self, samples=5):
         """Capture EM baseline without transmitting."""
         mon = Monitor(log_dir=self.config['log_dir'])
@@ -99,17 +126,16 @@ class HydrogenLineBeacon:
             print("RTL-SDR not detected. Connect an RTL-SDR dongle.")
     
     def check_hardware(self):
-        """Check what hardware is available."""
+        """Check what hardware is available (probes run concurrently)."""
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            hackrf = ex.submit(RFChannel.is_available)
+            rtlsdr = ex.submit(Monitor.is_available)
+            aplay = ex.submit(_aplay_available)
+        
         print("Hardware check:")
-        print(f"  HackRF One:  {'✓ Connected' if RFChannel.is_available() else '✗ Not found'}")
-        print(f"  RTL-SDR:     {'✓ Connected' if Monitor.is_available() else '✗ Not found'}")
-        print(f"  Audio (aplay): ", end="")
-        import subprocess
-        try:
-            subprocess.run(["aplay", "--version"], capture_output=True, timeout=3)
-            print("✓ Available")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            print("✗ Not found")
+        print(f"  HackRF One:  {'✓ Connected' if hackrf.result() else '✗ Not found'}")
+        print(f"  RTL-SDR:     {'✓ Connected' if rtlsdr.result() else '✗ Not found'}")
+        print(f"  Audio (aplay): {'✓ Available' if aplay.result() else '✗ Not found'}")
     
     @staticmethod
     def legal_info():
@@ -20,6 +20,7 @@ Examples:
   hlb --programme pulsed           Prime-number pulse timing
   hlb --generate mech.wav          Generate WAV only (no playback)
   hlb --check                      Check connected hardware
+  hlb --precompile                 Compile numba kernels (run once after install)
   hlb --legal                      Print legal frequency info
 
 Programmes:
@@ -56,6 +57,8 @@ Programmes:
                        help='Print legal frequency information')
     parser.add_argument('--baseline', action='store_true',
                        help='Capture EM baseline only (no transmission)')
+    parser.add_argument('--precompile', action='store_true',
+                       help='Compile and cache the numba kernels, then exit')
     
     args = parser.parse_args()
     
@@ -78,6 +81,8 @@ Programmes:
         beacon.generate_rf_baseband(args.generate_rf, min(args.duration, 60))
     elif args.baseline:
         beacon.scan_baseline()
+    elif args.precompile:
+        beacon.precompile()
     else:
         beacon.run()
 
@@ -0,0 +1,60 @@
+"""
+Prime number generation for pulse timing.
+Segmented Sieve of Eratosthenes; results are cached and returned read-only.
+"""
+
+import functools
+import math
+import numpy as np
+
+# Sieve segment length: 32 KiB of flags, small enough to stay in cache
+SEGMENT = 32 * 1024
+
+
+def primes_up_to(n):
+    """All primes <= n, ascending, as a read-only int64 array."""
+    if n < 2:
+        return np.empty(0, dtype=np.int64)
+    primes = _sieve(_bucket(n))
+    return primes[:np.searchsorted(primes, n, side='right')]
+
+
+def nth_prime(k):
+    """The k-th prime, counting from nth_prime(1) == 2."""
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    # Rosser's bound: p_k < k (ln k + ln ln k) for k >= 6
+    bound = 13 if k < 6 else int(k * (math.log(k) + math.log(math.log(k)))) + 1
+    return int(primes_up_to(bound)[k - 1])
+
+
+def _bucket(n):
+    """Round n up to a power of two, so nearby limits share one cached sieve."""
+    return 1 << (n - 1).bit_length()
+
+
+@functools.lru_cache(maxsize=16)
+def _sieve(limit):
+    """Primes <= limit: plain sieve up to sqrt(limit), then segment by segment."""
+    root = math.isqrt(limit)
+    base = np.ones(root + 1, dtype=np.bool_)
+    base[:2] = False
+    for p in range(2, math.isqrt(root) + 1):
+        if base[p]:
+            base[p * p::p] = False
+    base_primes = np.flatnonzero(base)
+    
+    found = [base_primes]
+    for lo in range(root + 1, limit + 1, SEGMENT):
+        hi = min(lo + SEGMENT, limit + 1)
+        segment = np.ones(hi - lo, dtype=np.bool_)
+        for p in base_primes.tolist():
+            if p * p >= hi:
+                break
+            first = max(p * p, -(-lo // p) * p)
+            segment[first - lo::p] = False
+        found.append(lo + np.flatnonzero(segment))
+    
+    primes = np.concatenate(found).astype(np.int64)
+    primes.flags.writeable = False
+    return primes
@@ -5,14 +5,21 @@ Coordinates RF transmission, mechanical transduction, and monitoring.
 
 import time
 import os
-import json
 import signal
 import tempfile
+import threading
 from datetime import datetime
+from scipy.io import wavfile
 from .constants import PROTOCOL_TX_DURATION, PROTOCOL_RX_DURATION, PROTOCOL_CYCLE_DURATION
 from .rf import RFChannel
 from .mechanical import MechanicalChannel
 from .monitor import Monitor
+from . import _jsonio
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # optional; OSError if PortAudio is missing
+    sd = None
 
 
 class ProtocolState:
@@ -43,9 +50,14 @@ class ProtocolController:
         self.state = ProtocolState.IDLE
         self.rf = None
         self.mech = MechanicalChannel()
-        self.monitor = Monitor(log_dir=self.config.get('log_dir', './hlb_logs'))
+        self.monitor = Monitor(
+            log_dir=self.config.get('log_dir', './hlb_logs'),
+            stream=self.config.get('monitor_stream', False),
+        )
         self.cycle_count = 0
         self.running = False
+        self._stop = threading.Event()
+        self._mech_audio = None  # (rate, memmapped samples) when using sounddevice
         self.session_id = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         
         # Session log
@@ -65,6 +77,7 @@ class ProtocolController:
             'anomaly_threshold': 3.0,
             'log_dir': './hlb_logs',
             'mech_wav': '/tmp/hlb_mech.wav',
+            'monitor_stream': False,
         }
     
     def initialise(self):
@@ -97,6 +110,9 @@ class ProtocolController:
         cycle_dur = self.config['cycle_duration']
         self.mech.save_wav(wav_file, self.config['mech_programme'], cycle_dur)
         print(f"  ✓ Saved {wav_file}")
+        if sd is not None:
+            # Map the WAV once; later cycles play it straight from the page cache
+            self._mech_audio = wavfile.read(wav_file, mmap=True)
         
         # Generate RF baseband
         if self.rf:
@@ -122,10 +138,12 @@ class ProtocolController:
     def run(self):
         """Execute the protocol loop."""
         self.running = True
+        self._stop.clear()
         
         # Handle shutdown
         def _shutdown(sig, frame):
             print("\n  Shutdown requested...")
+            self._stop.set()
             self.running = False
         
         signal.signal(signal.SIGINT, _shutdown)
@@ -194,6 +212,31 @@ class ProtocolController:
             print(f"    RF: {self.config['rf_carrier']/1e6:.3f} MHz")
         
         # Play mechanical (blocking for tx_duration)
+        if self._mech_audio is None or not self._play_mapped(tx_dur):
+            self._play_aplay(tx_dur)
+        
+        # Stop RF
+        if self.rf:
+            self.rf.stop()
+        
+        self._log('transmit', {'duration': tx_dur})
+        print(f"    ✓ Transmit complete")
+    
+    def _play_mapped(self, tx_dur):
+        """Play the memory-mapped WAV via sounddevice; False if no audio device."""
+        rate, samples = self._mech_audio
+        try:
+            sd.play(samples, samplerate=rate)
+        except sd.PortAudioError:
+            return False
+        
+        # Wait for tx_duration or until stopped
+        self._stop.wait(timeout=tx_dur)
+        sd.stop()
+        return True
+    
+    def _play_aplay(self, tx_dur):
+        """Play the WAV through an aplay subprocess."""
         import subprocess
         try:
             proc = subprocess.Popen(
@@ -202,22 +245,13 @@ class ProtocolController:
             )
             
             # Wait for tx_duration or until stopped
-            start = time.monotonic()
-            while self.running and (time.monotonic() - start) < tx_dur:
-                time.sleep(0.5)
+            self._stop.wait(timeout=tx_dur)
             
             proc.terminate()
             proc.wait(timeout=3)
         except FileNotFoundError:
             # aplay not available — just wait
-            time.sleep(tx_dur)
-        
-        # Stop RF
-        if self.rf:
-            self.rf.stop()
-        
-        self._log('transmit', {'duration': tx_dur})
-        print(f"    ✓ Transmit complete")
+            self._stop.wait(timeout=tx_dur)
     
     def _listen_phase(self):
         """Phase 2: Passive listening."""
@@ -225,9 +259,7 @@ class ProtocolController:
         rx_dur = self.config['rx_duration']
         print(f"  ◉ LISTEN ({rx_dur}s)")
         
-        start = time.monotonic()
-        while self.running and (time.monotonic() - start) < rx_dur:
-            time.sleep(1)
+        self._stop.wait(timeout=rx_dur)
         
         self._log('listen', {'duration': rx_dur})
         print(f"    ✓ Listen complete")
@@ -288,13 +320,14 @@ class ProtocolController:
     def _shutdown(self):
         """Clean shutdown."""
         print("\n  ■ Shutting down...")
+        self._stop.set()
         self.running = False
         
         if self.rf:
             self.rf.stop()
             print("    ✓ RF stopped")
         
-        self.monitor.stop_continuous()
+        self.monitor.close()
         print("    ✓ Monitor stopped")
         
         # Save session summary
@@ -313,8 +346,8 @@ class ProtocolController:
             self.config['log_dir'],
             f"session_{self.session_id}.json"
         )
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(summary_file, 'wb') as f:
+            f.write(_jsonio.dumps_pretty(summary))
         
         print(f"    ✓ Session saved to {summary_file}")
         print(f"\n  Session {self.session_id}: {self.cycle_count} cycles complete.\n")
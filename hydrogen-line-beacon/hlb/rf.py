@@ -5,13 +5,21 @@ Generates IQ baseband samples and controls HackRF for transmission.
 
 import numpy as np
 import subprocess
+import time
 import os
 import tempfile
 from .constants import (
     HYDROGEN_LINE_HZ, RF_SAMPLE_RATE, RF_DEFAULT_GAIN,
     SCHUMANN_FREQUENCIES, ISM_BANDS
 )
-from .waveforms import schumann_envelope, prime_pulse_gate, normalise, to_iq_int8
+from .waveforms import prime_gate_chunks, schumann_iq, schumann_iq_chunks
+
+# Write buffer for IQ files
+IQ_BUFFER_BYTES = 1024 * 1024
+
+# hackrf_info results are reused for this many seconds
+HARDWARE_CACHE_SECONDS = 5.0
+_AVAIL_CACHE = None  # (monotonic timestamp, available)
 
 
 class RFChannel:
@@ -33,14 +41,29 @@ class RFChannel:
     
     @staticmethod
     def is_available():
-        """Check if HackRF tools are installed and a device is connected."""
+        """
+        Check if HackRF tools are installed and a device is connected.
+        The hackrf_info result is cached for HARDWARE_CACHE_SECONDS.
+        """
+        global _AVAIL_CACHE
+        now = time.monotonic()
+        if _AVAIL_CACHE is not None and now - _AVAIL_CACHE[0] < HARDWARE_CACHE_SECONDS:
+            return _AVAIL_CACHE[1]
         try:
             result = subprocess.run(
                 ["hackrf_info"], capture_output=True, text=True, timeout=5
             )
-            return result.returncode == 0
+            available = result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            available = False
+        _AVAIL_CACHE = (now, available)
+        return available
+    
+    @staticmethod
+    def invalidate_hardware_cache():
+        """Forget the cached is_available result (e.g. after plugging in)."""
+        global _AVAIL_CACHE
+        _AVAIL_CACHE = None
     
     def generate_baseband(self, duration, modulation="schumann", pulsed=True):
         """
@@ -50,36 +73,57 @@ class RFChannel:
             schumann — AM with full Schumann resonance series
             cw       — continuous wave (no modulation)
             single   — AM with fundamental Schumann only (7.83 Hz)
+        
+        The I channel carries the (gated) envelope and Q stays zero —
+        real-valued AM, HackRF handles upconversion to carrier. Output
+        matches iter_baseband; the Schumann modulations come from
+        schumann_iq, which sums the modes once rather than twice when
+        numba is unavailable. CW blocks are written straight into the
+        int8 buffer.
         """
-        n_samples = int(self.sr * duration)
+        if modulation != "cw":
+            weights = {1: 1.0} if modulation == "single" else None
+            return schumann_iq(duration, weights, self.sr, pulsed)
+        iq = np.empty(2 * int(self.sr * duration), dtype=np.int8)
+        pos = 0
+        for block in self.iter_baseband(duration, modulation, pulsed):
+            iq[pos:pos + len(block)] = block
+            pos += len(block)
+        return iq
+    
+    def iter_baseband(self, duration, modulation="schumann", pulsed=True,
+                      chunk_sec=1.0):
+        """
+        Streaming generate_baseband: yields interleaved IQ int8 blocks of
+        chunk_sec seconds, so memory stays at one block for any duration.
         
-        if modulation == "schumann":
-            envelope = schumann_envelope(duration, sr=self.sr)
-        elif modulation == "single":
-            envelope = schumann_envelope(
-                duration, mode_weights={1: 1.0}, sr=self.sr
-            )
-        elif modulation == "cw":
-            envelope = np.ones(n_samples)
-        else:
-            envelope = schumann_envelope(duration, sr=self.sr)
+        The I channel is scaled against the envelope's full scale (1.0)
+        rather than the measured peak of the whole gated signal.
+        """
+        if modulation != "cw":
+            weights = {1: 1.0} if modulation == "single" else None
+            yield from schumann_iq_chunks(duration, weights, self.sr, pulsed, chunk_sec)
+            return
         
-        # Apply prime pulse gating
+        # CW: the gate (or a constant carrier) is the whole envelope
+        n_samples = int(self.sr * duration)
+        step = max(1, int(self.sr * chunk_sec))
         if pulsed:
-            gate = prime_pulse_gate(duration, self.sr)
-            envelope = envelope * gate
-        
-        # IQ: envelope modulates I channel, Q stays zero
-        # (real-valued AM — HackRF handles upconversion to carrier)
-        i_signal = envelope
-        q_signal = np.zeros_like(envelope)
+            envelopes = (gate for _, gate in prime_gate_chunks(duration, self.sr, chunk_sec))
+        else:
+            envelopes = (np.ones(min(step, n_samples - i0))
+                         for i0 in range(0, n_samples, step))
         
-        return to_iq_int8(i_signal, q_signal)
+        for envelope in envelopes:
+            iq = np.zeros(len(envelope) * 2, dtype=np.int8)
+            iq[0::2] = np.int8(envelope * (0.99 * 127))
+            yield iq
     
-    def save_baseband(self, filename, duration=60, **kwargs):
-        """Generate and save IQ baseband to file."""
-        iq = self.generate_baseband(duration, **kwargs)
-        iq.tofile(filename)
+    def save_baseband(self, filename, duration=60, chunk_sec=1.0, **kwargs):
+        """Generate and save IQ baseband to file, streamed in chunks."""
+        with open(filename, 'wb', buffering=IQ_BUFFER_BYTES) as f:
+            for iq in self.iter_baseband(duration, chunk_sec=chunk_sec, **kwargs):
+                f.write(iq)
         return filename
     
     def transmit(self, iq_file, repeat=True):
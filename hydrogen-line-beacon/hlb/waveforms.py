@@ -1,126 +1,455 @@
 """
 Waveform generation primitives.
 All functions return numpy float64 arrays normalised to [-1, 1].
+Those taking dtype= can store float32 instead; sample times and phases are
+still computed in float64, only the output is narrowed.
 """
 
+import functools
 import numpy as np
-from .constants import SCHUMANN_FREQUENCIES, PRIMES, AUDIO_SAMPLE_RATE
+from .constants import SCHUMANN_FREQUENCIES, AUDIO_SAMPLE_RATE
+from .primes import primes_up_to
 
+try:
+    from . import _waveforms_numba as _nb
+except ImportError:  # numba is optional — fall back to NumPy
+    _nb = None
 
-def sine(freq, duration, sr=AUDIO_SAMPLE_RATE):
+# True when the numba kernels are in use (the optional 'fast' extra)
+HAVE_NUMBA = _nb is not None
+
+try:
+    import numexpr as _ne
+except ImportError:  # numexpr is optional — plain NumPy without numba
+    _ne = None
+
+# Typed copies of the constants for the numeric paths
+_SCHUMANN_FREQS = np.asarray(SCHUMANN_FREQUENCIES, dtype=np.float64)
+_DEFAULT_MODE_WEIGHTS = np.array([1.0, 0.7, 0.5, 0.3, 0.2])
+_DEFAULT_MODE_WEIGHTS.flags.writeable = False  # handed out by reference
+
+# Largest result the envelope / gate caches hold per entry. Audio-rate
+# segments fit; RF-rate buffers (80 MB for 5 s at 2 MHz) are built per call.
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _time_axis(n, sr):
+    """Sample times i/sr for i in 0..n-1, as a multiply by 1/sr."""
+    return np.arange(n, dtype=np.float64) * (1.0 / sr)
+
+
+def sine(freq, duration, sr=AUDIO_SAMPLE_RATE, dtype=np.float64):
     """Pure sine wave."""
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    return np.sin(2 * np.pi * freq * t)
+    if _nb is not None:
+        n = int(sr * duration)
+        return _nb.sine_k(float(freq), n, float(sr), np.empty(n, dtype=dtype))
+    t = _time_axis(int(sr * duration), sr)
+    return np.sin(2 * np.pi * freq * t).astype(dtype, copy=False)
 
 
-def am_modulate(carrier_freq, mod_freq, duration, depth=1.0, sr=AUDIO_SAMPLE_RATE):
+def am_modulate(carrier_freq, mod_freq, duration, depth=1.0, sr=AUDIO_SAMPLE_RATE,
+                dtype=np.float64):
     """Amplitude modulation: carrier modulated by mod_freq."""
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
+    if _nb is not None:
+        n = int(sr * duration)
+        return _nb.am_k(float(carrier_freq), float(mod_freq), float(depth), n,
+                        float(sr), np.empty(n, dtype=dtype))
+    t = _time_axis(int(sr * duration), sr)
+    if _ne is not None:
+        # One blocked, multi-threaded pass instead of three temporaries
+        am = _ne.evaluate(
+            "sin(wc * t) * (0.5 * (1 + depth * sin(wm * t)))",
+            local_dict={'t': t, 'wc': 2 * np.pi * carrier_freq,
+                        'wm': 2 * np.pi * mod_freq, 'depth': float(depth)},
+        )
+        return am.astype(dtype, copy=False)
     carrier = np.sin(2 * np.pi * carrier_freq * t)
     modulator = 0.5 * (1 + depth * np.sin(2 * np.pi * mod_freq * t))
-    return carrier * modulator
+    return (carrier * modulator).astype(dtype, copy=False)
 
 
-def schumann_envelope(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE):
+def schumann_envelope(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE,
+                      dtype=np.float64):
     """
     Combined Schumann resonance envelope.
     Returns a low-frequency modulation signal combining all 5 modes.
     
+    The result is returned read-only; copy it before modifying in place.
+    Results up to CACHE_MAX_BYTES are cached per (duration, mode_weights,
+    sr, dtype).
+    
     Args:
-        mode_weights: dict {mode_number: weight} or None for equal weights
+        mode_weights: dict {mode_number: weight}, array of per-mode weights,
+                      or None for the default 1.0/0.7/0.5/0.3/0.2 weighting
     """
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    if mode_weights is None:
-        mode_weights = {1: 1.0, 2: 0.7, 3: 0.5, 4: 0.3, 5: 0.2}
+    weights = _mode_weight_array(mode_weights)
+    dtype = np.dtype(dtype)
+    if int(sr * duration) * dtype.itemsize > CACHE_MAX_BYTES:
+        envelope = _compute_schumann_envelope(duration, weights, sr, dtype)
+        envelope.flags.writeable = False
+        return envelope
+    return _schumann_envelope(duration, sr, tuple(weights.tolist()), dtype)
+
+
+@functools.lru_cache(maxsize=8)
+def _schumann_envelope(duration, sr, weights, dtype):
+    """Cached body of schumann_envelope; weights is a per-mode tuple."""
+    envelope = _compute_schumann_envelope(duration, np.array(weights), sr, dtype)
+    envelope.flags.writeable = False
+    return envelope
+
+
+def _compute_schumann_envelope(duration, weights, sr, dtype=np.float64):
+    """Uncached Schumann envelope, normalised to [0, 1]."""
+    if _nb is not None:
+        n = int(sr * duration)
+        return _nb.schumann_k(weights, _SCHUMANN_FREQS, n, float(sr),
+                              np.empty(n, dtype=dtype))
     
+    t = _time_axis(int(sr * duration), sr)
     envelope = np.zeros_like(t)
-    for mode, freq in enumerate(SCHUMANN_FREQUENCIES, 1):
-        weight = mode_weights.get(mode, 0)
+    for weight, freq in zip(weights, _SCHUMANN_FREQS):
         envelope += weight * np.sin(2 * np.pi * freq * t)
     
     # Normalise to [0, 1] for use as modulation envelope
     envelope = (envelope - envelope.min()) / (envelope.max() - envelope.min())
-    return envelope
+    return envelope.astype(dtype, copy=False)
+
+
+def _mode_weight_array(mode_weights):
+    """Mode weights (dict, per-mode array or None) → float64 array aligned with _SCHUMANN_FREQS."""
+    if mode_weights is None:
+        return _DEFAULT_MODE_WEIGHTS
+    if isinstance(mode_weights, dict):
+        return np.array([mode_weights.get(mode, 0)
+                         for mode in range(1, len(_SCHUMANN_FREQS) + 1)],
+                        dtype=np.float64)
+    weights = np.asarray(mode_weights, dtype=np.float64)
+    if weights.shape != _SCHUMANN_FREQS.shape:
+        raise ValueError(
+            f"Expected {len(_SCHUMANN_FREQS)} mode weights, got {weights.shape}"
+        )
+    return weights
+
+
+def schumann_sum(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE, dtype=np.float64):
+    """
+    Weighted sum of the Schumann mode sines, not rescaled.
+    All modes are accumulated in one pass instead of one array per mode.
+    """
+    weights = _mode_weight_array(mode_weights)
+    return _schumann_sum(weights, 0, int(sr * duration), sr, dtype)
+
+
+def _schumann_sum(weights, i0, n, sr, dtype=np.float64):
+    """Raw weighted Schumann mode sum for samples i0 .. i0+n-1."""
+    if _nb is not None:
+        return _nb.schumann_sum_k(weights, _SCHUMANN_FREQS, i0, n, float(sr),
+                                  np.empty(n, dtype=dtype))
+    t = (i0 + np.arange(n)) * (1.0 / sr)
+    out = np.zeros(n)
+    for weight, freq in zip(weights, _SCHUMANN_FREQS):
+        out += weight * np.sin(2 * np.pi * freq * t)
+    return out.astype(dtype, copy=False)
+
+
+def _schumann_range(weights, n, sr, step):
+    """(min, max) of the raw mode sum over n samples, one chunk at a time."""
+    if _nb is not None:
+        return _nb.schumann_range_k(weights, _SCHUMANN_FREQS, n, float(sr))
+    lo, hi = np.inf, -np.inf
+    for i0 in range(0, n, step):
+        raw = _schumann_sum(weights, i0, min(step, n - i0), sr)
+        lo = min(lo, raw.min())
+        hi = max(hi, raw.max())
+    return lo, hi
+
+
+def schumann_chunks(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE, chunk_sec=1.0):
+    """
+    Streaming schumann_envelope: yields (t_offset, chunk) pairs.
+    
+    Makes two passes (min/max, then output) so that chunks share the
+    whole-duration [0, 1] normalisation while only one chunk is held
+    in memory at a time.
+    """
+    weights = _mode_weight_array(mode_weights)
+    n = int(sr * duration)
+    step = max(1, int(sr * chunk_sec))
+    
+    lo, hi = _schumann_range(weights, n, sr, step)
+    for i0 in range(0, n, step):
+        raw = _schumann_sum(weights, i0, min(step, n - i0), sr)
+        yield i0 / sr, (raw - lo) / (hi - lo)
+
 
+def _gate_primes(n_samples, sr):
+    """The shortest run of primes (seconds) whose sum covers n_samples."""
+    total = n_samples / sr
+    bound = 128
+    while True:
+        primes = primes_up_to(bound)
+        ends = np.cumsum(primes)
+        if ends[-1] >= total:
+            return primes[:np.searchsorted(ends, total) + 1]
+        bound *= 2
 
-def prime_pulse_gate(duration, sr=AUDIO_SAMPLE_RATE):
+
+def _prime_gate_intervals(n_samples, sr):
+    """(starts, ends) sample indices of the spans where the prime pulse gate is on."""
+    primes = _gate_primes(n_samples, sr)
+    # Boundaries in whole seconds: on for primes[0], off for primes[1], ...
+    t = np.concatenate(([0], np.cumsum(primes)))
+    starts = (t[:-1:2] * sr).astype(np.int64)
+    ends = np.minimum((t[1::2] * sr).astype(np.int64), n_samples)
+    keep = starts < n_samples
+    return starts[keep], ends[keep]
+
+
+def prime_gate_chunks(duration, sr=AUDIO_SAMPLE_RATE, chunk_sec=1.0):
+    """Streaming prime_pulse_gate: yields (t_offset, chunk) pairs."""
+    n_samples = int(sr * duration)
+    step = max(1, int(sr * chunk_sec))
+    starts, ends = _prime_gate_intervals(n_samples, sr)
+    for i0 in range(0, n_samples, step):
+        i1 = min(i0 + step, n_samples)
+        gate = np.zeros(i1 - i0)
+        # Only the spans overlapping [i0, i1)
+        first = np.searchsorted(ends, i0, side='right')
+        last = np.searchsorted(starts, i1)
+        for start, end in zip(starts[first:last].tolist(), ends[first:last].tolist()):
+            gate[max(start, i0) - i0:min(end, i1) - i0] = 1.0
+        yield i0 / sr, gate
+
+
+def schumann_iq_chunks(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE,
+                       pulsed=True, chunk_sec=1.0):
+    """
+    Streaming HackRF baseband: the Schumann envelope (prime-gated if pulsed)
+    on I with Q = 0, as interleaved int8 blocks of chunk_sec seconds.
+    I is scaled so that an envelope of 1.0 maps to 0.99 of int8 full scale.
+    """
+    weights = _mode_weight_array(mode_weights)
+    n = int(sr * duration)
+    step = max(1, int(sr * chunk_sec))
+    
+    if _nb is None:
+        gates = prime_gate_chunks(duration, sr, chunk_sec) if pulsed else None
+        for _, envelope in schumann_chunks(duration, weights, sr, chunk_sec):
+            if gates is not None:
+                envelope = envelope * next(gates)[1]
+            iq = np.zeros(len(envelope) * 2, dtype=np.int8)
+            iq[0::2] = np.int8(envelope * (0.99 * 127))
+            yield iq
+        return
+    
+    # One fused pass per block: envelope, gate, rescale and int8 store
+    lo, hi = _schumann_range(weights, n, sr, step)
+    if pulsed:
+        gate_starts, gate_ends = _prime_gate_intervals(n, sr)
+    else:
+        gate_starts = np.zeros(1, dtype=np.int64)
+        gate_ends = np.full(1, n, dtype=np.int64)
+    for i0 in range(0, n, step):
+        m = min(step, n - i0)
+        yield _nb.build_iq_i8_k(weights, _SCHUMANN_FREQS, lo, hi - lo,
+                                gate_starts, gate_ends, i0, m, float(sr),
+                                np.empty(m * 2, dtype=np.int8))
+
+
+def schumann_iq(duration, mode_weights=None, sr=AUDIO_SAMPLE_RATE, pulsed=True,
+                chunk_sec=1.0):
+    """
+    In-memory schumann_iq_chunks: the whole baseband as one int8 array.
+    
+    Without numba the mode sum is computed once into a float64 buffer and
+    rescaled from there, rather than summed twice as the streaming
+    min/max-then-output passes must; output is identical.
+    """
+    n = int(sr * duration)
+    iq = np.zeros(2 * n, dtype=np.int8)
+    if _nb is not None or n == 0:
+        pos = 0
+        for block in schumann_iq_chunks(duration, mode_weights, sr, pulsed, chunk_sec):
+            iq[pos:pos + len(block)] = block
+            pos += len(block)
+        return iq
+    
+    weights = _mode_weight_array(mode_weights)
+    step = max(1, int(sr * chunk_sec))
+    raw = np.empty(n)
+    for i0 in range(0, n, step):
+        raw[i0:i0 + step] = _schumann_sum(weights, i0, min(step, n - i0), sr)
+    lo, hi = raw.min(), raw.max()
+    gates = prime_gate_chunks(duration, sr, chunk_sec) if pulsed else None
+    for i0 in range(0, n, step):
+        envelope = (raw[i0:i0 + step] - lo) / (hi - lo)
+        if gates is not None:
+            envelope *= next(gates)[1]
+        iq[2 * i0:2 * (i0 + len(envelope)):2] = np.int8(envelope * (0.99 * 127))
+    return iq
+
+
+def prime_pulse_gate(duration, sr=AUDIO_SAMPLE_RATE, dtype=np.float64):
     """
     Prime number pulse gate: on for p_n seconds, off for p_{n+1} seconds.
     Returns array of 0s and 1s.
+    
+    The result is returned read-only; copy it before modifying in place.
+    Gates up to CACHE_MAX_BYTES are cached per (samples, sr, dtype).
     """
     n_samples = int(sr * duration)
-    gate = np.zeros(n_samples)
-    
-    t = 0
-    prime_idx = 0
-    on = True
-    
-    while t < duration and prime_idx < len(PRIMES):
-        p = PRIMES[prime_idx % len(PRIMES)]
-        start = int(t * sr)
-        end = min(int((t + p) * sr), n_samples)
-        
-        if on:
+    dtype = np.dtype(dtype)
+    if n_samples * dtype.itemsize > CACHE_MAX_BYTES:
+        return _compute_prime_pulse_gate(n_samples, sr, dtype)
+    return _prime_pulse_gate(n_samples, sr, dtype)
+
+
+@functools.lru_cache(maxsize=8)
+def _prime_pulse_gate(n_samples, sr, dtype):
+    """Cached body of prime_pulse_gate."""
+    return _compute_prime_pulse_gate(n_samples, sr, dtype)
+
+
+def _compute_prime_pulse_gate(n_samples, sr, dtype):
+    """Uncached read-only prime pulse gate of n_samples."""
+    gate = np.zeros(n_samples, dtype=dtype)
+    
+    if _nb is not None:
+        _nb.prime_gate_k(n_samples, float(sr), _gate_primes(n_samples, sr), gate)
+    else:
+        starts, ends = _prime_gate_intervals(n_samples, sr)
+        for start, end in zip(starts.tolist(), ends.tolist()):
             gate[start:end] = 1.0
-        
-        t += p
-        on = not on
-        prime_idx += 1
     
+    gate.flags.writeable = False
     return gate
 
 
-def chirp(f_start, f_end, duration, sr=AUDIO_SAMPLE_RATE):
+def chirp(f_start, f_end, duration, sr=AUDIO_SAMPLE_RATE, dtype=np.float64):
     """Linear frequency sweep."""
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    freq = f_start + (f_end - f_start) * (t / duration)
-    phase = 2 * np.pi * np.cumsum(freq) / sr
-    return np.sin(phase)
+    k = (f_end - f_start) / duration
+    if _nb is not None:
+        n = int(sr * duration)
+        return _nb.chirp_k(float(f_start), float(k), n, float(sr), np.empty(n, dtype=dtype))
+    t = _time_axis(int(sr * duration), sr)
+    return np.sin(2 * np.pi * (f_start * t + 0.5 * k * t * t)).astype(dtype, copy=False)
 
 
-def breathing_envelope(duration, breath_rate=0.25, sr=AUDIO_SAMPLE_RATE):
+def breathing_envelope(duration, breath_rate=0.25, sr=AUDIO_SAMPLE_RATE,
+                       dtype=np.float64):
     """Smooth breathing-like amplitude envelope."""
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    return (0.5 * (1 + np.sin(2 * np.pi * breath_rate * t))) ** 2
+    n = int(sr * duration)
+    period = sr / breath_rate
+    if period.is_integer() and n > period:
+        # A whole number of samples per breath: compute one and repeat it
+        return np.resize(_breathing(int(period), breath_rate, sr, dtype), n)
+    return _breathing(n, breath_rate, sr, dtype)
+
+
+def _breathing(n, breath_rate, sr, dtype):
+    """First n samples of the breathing envelope."""
+    if _nb is not None:
+        return _nb.breathing_k(float(breath_rate), n, float(sr), np.empty(n, dtype=dtype))
+    t = _time_axis(n, sr)
+    return ((0.5 * (1 + np.sin(2 * np.pi * breath_rate * t))) ** 2).astype(dtype, copy=False)
 
 
 def ping(freq, duration, interval, ping_length=0.05, sr=AUDIO_SAMPLE_RATE):
     """Periodic short pings at given frequency."""
     n_samples = int(sr * duration)
-    t = np.linspace(0, duration, n_samples, endpoint=False)
     signal = np.zeros(n_samples)
     ping_samples = int(ping_length * sr)
     
-    for start_time in np.arange(0, duration, interval):
-        start_idx = int(start_time * sr)
-        end_idx = min(start_idx + ping_samples, n_samples)
-        if end_idx > start_idx:
-            ping_t = t[start_idx:end_idx] - t[start_idx]
-            envelope = np.exp(-ping_t * 40)
-            signal[start_idx:end_idx] = np.sin(2 * np.pi * freq * t[start_idx:end_idx]) * envelope
+    starts = (np.arange(0, duration, interval) * sr).astype(np.int64)
+    starts = starts[starts < n_samples]
+    if ping_samples == 0 or len(starts) == 0:
+        return signal
+    
+    # One decaying template pair, rotated to each ping's start phase:
+    # sin(w(t0 + tp)) = cos(w t0) sin(w tp) + sin(w t0) cos(w tp)
+    w = 2 * np.pi * freq
+    tp = _time_axis(ping_samples, sr)
+    envelope = np.exp(-tp * 40)
+    sin_tpl = np.sin(w * tp) * envelope
+    cos_tpl = np.cos(w * tp) * envelope
+    
+    phase = w * starts / sr
+    pings = np.cos(phase)[:, None] * sin_tpl + np.sin(phase)[:, None] * cos_tpl
+    idx = starts[:, None] + np.arange(ping_samples)
+    inside = idx < n_samples
+    signal[idx[inside]] = pings[inside]
     
     return signal
 
 
 def normalise(signal, peak=0.9):
     """Normalise signal to [-peak, peak]."""
-    max_val = np.max(np.abs(signal))
+    signal = np.asarray(signal)
+    if _nb is not None and signal.ndim == 1 and signal.dtype.kind == 'f':
+        return _nb.normalise_k(signal, float(peak), np.empty_like(signal))
+    # Peak from two reductions, without an abs() copy of the signal
+    max_val = max(signal.max(), -signal.min())
     if max_val > 0:
-        return signal / max_val * peak
+        out = signal / max_val
+        out *= peak
+        return out
     return signal
 
 
 def to_int16(signal):
-    """Convert float64 signal to 16-bit PCM."""
-    return np.int16(normalise(signal) * 32767)
+    """Convert a float signal (float64 or float32) to 16-bit PCM."""
+    signal = np.asarray(signal)
+    if _nb is not None and signal.ndim == 1 and signal.dtype.kind == 'f':
+        # Peak, scale and cast fused: no float copy of the signal
+        return _nb.pcm16_k(signal, 0.9, np.empty(signal.shape, dtype=np.int16))
+    pcm = normalise(signal)
+    if np.may_share_memory(pcm, signal):
+        pcm = pcm.copy()  # all-zero input comes back as itself
+    pcm *= 32767
+    return pcm.astype(np.int16)
 
 
 def to_iq_int8(i_signal, q_signal=None):
     """Convert to interleaved IQ int8 for HackRF."""
-    if q_signal is None:
-        q_signal = np.zeros_like(i_signal)
+    i_signal = np.asarray(i_signal)
+    q_signal = np.zeros_like(i_signal) if q_signal is None else np.asarray(q_signal)
     n = len(i_signal)
+    if len(q_signal) != n:
+        raise ValueError(f"I and Q lengths differ: {n} vs {len(q_signal)}")
     iq = np.empty(n * 2, dtype=np.int8)
+    if (_nb is not None and i_signal.ndim == 1 and q_signal.ndim == 1
+            and i_signal.dtype.kind == 'f' and q_signal.dtype.kind == 'f'):
+        return _nb.pack_iq_k(i_signal, q_signal, iq)
     iq[0::2] = np.int8(normalise(i_signal, 0.99) * 127)
     iq[1::2] = np.int8(normalise(q_signal, 0.99) * 127)
     return iq
+
+
+def precompile():
+    """
+    Call every waveform kernel once on a few samples, for float32 and
+    float64 output and for read-only (cached) input, so numba compiles
+    each signature into its on-disk cache. Returns False without numba.
+    """
+    if not HAVE_NUMBA:
+        return False
+    sr, duration = 1000, 0.01
+    n = int(sr * duration)
+    for dtype in (np.dtype(np.float32), np.dtype(np.float64)):
+        sine(7.83, duration, sr, dtype)
+        am_modulate(7.83, 0.25, duration, sr=sr, dtype=dtype)
+        chirp(1.0, 20.0, duration, sr, dtype)
+        breathing_envelope(duration, sr=sr, dtype=dtype)
+        _compute_prime_pulse_gate(n, sr, dtype)
+        # The default weights are read-only, caller-supplied ones are not
+        for weights in (_DEFAULT_MODE_WEIGHTS, _DEFAULT_MODE_WEIGHTS.copy()):
+            schumann_sum(duration, weights, sr, dtype)
+            signal = _compute_schumann_envelope(duration, weights, sr, dtype)
+        for writeable in (True, False):
+            signal.flags.writeable = writeable
+            normalise(signal)
+            to_int16(signal)
+            to_iq_int8(signal)
+            to_iq_int8(signal, signal)
+    return True
@@ -7,7 +7,9 @@ Channels:
   2. Mechanical — Ground-coupled seismic transduction at Schumann frequencies
 
 Requires: numpy, scipy
-Optional: hackrf (for RF channel), sounddevice (for live playback)
+Optional: hackrf (for RF channel), sounddevice (for live playback),
+          numba (JIT waveform kernels), pyrtlsdr (streaming monitor),
+          orjson (fast event logging), numexpr (NumPy-path fusion)
 """
 
 __version__ = "0.1.0"
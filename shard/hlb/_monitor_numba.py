@@ -0,0 +1,17 @@
+"""
+Numba kernels for the monitor's baseline statistics.
+Imported by monitor.py when numba is installed; raises ImportError otherwise.
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def welford_update_k(count, mean, m2, idx, x):
+    """Fold one scan (x at grid positions idx) into running count/mean/M2."""
+    for j in range(idx.shape[0]):
+        k = idx[j]
+        count[k] += 1
+        delta = x[j] - mean[k]
+        mean[k] += delta / count[k]
+        m2[k] += delta * (x[j] - mean[k])
@@ -0,0 +1,210 @@
+"""
+Numba kernels for the waveform primitives.
+Imported by waveforms.py when numba is installed; raises ImportError otherwise.
+"""
+
+import math
+import numpy as np
+from numba import njit, prange
+
+TWO_PI = 2.0 * math.pi
+
+# Samples per cache block in the Schumann kernels: 64 KiB of float64
+BLOCK = 8192
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def sine_k(freq, n, sr, out):
+    """out[i] = sin(2*pi*freq*t)."""
+    w = TWO_PI * freq
+    inv_sr = 1.0 / sr  # hoisted: a divide in the loop blocks vectorisation
+    for i in prange(n):
+        t = i * inv_sr
+        out[i] = math.sin(w * t)
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def am_k(carrier, mod, depth, n, sr, out):
+    """Carrier times 0.5*(1 + depth*sin(mod)), in one pass."""
+    wc = TWO_PI * carrier
+    wm = TWO_PI * mod
+    inv_sr = 1.0 / sr
+    for i in prange(n):
+        t = i * inv_sr
+        out[i] = math.sin(wc * t) * 0.5 * (1.0 + depth * math.sin(wm * t))
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def _mode_sum_block(weights, freqs, i0, start, end, inv_sr, out):
+    """out[start:end] = weighted mode sum at samples i0+start .. i0+end-1."""
+    for i in range(start, end):
+        out[i] = 0.0
+    # Mode-outer, so each inner loop is a single vectorisable sin
+    for m in range(freqs.shape[0]):
+        w = weights[m]
+        wm = TWO_PI * freqs[m]
+        for i in range(start, end):
+            out[i] += w * math.sin(wm * ((i0 + i) * inv_sr))
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def schumann_k(weights, freqs, n, sr, out):
+    """Weighted sum of Schumann modes, rescaled to [0, 1]."""
+    inv_sr = 1.0 / sr
+    n_blocks = (n + BLOCK - 1) // BLOCK
+    if n_blocks == 0:
+        return out
+    lo = np.empty(n_blocks)
+    hi = np.empty(n_blocks)
+    for b in prange(n_blocks):
+        start = b * BLOCK
+        end = min(start + BLOCK, n)
+        _mode_sum_block(weights, freqs, 0, start, end, inv_sr, out)
+        lo[b] = out[start:end].min()
+        hi[b] = out[start:end].max()
+    lo_all = lo.min()
+    span = hi.max() - lo_all
+    for i in prange(n):
+        out[i] = (out[i] - lo_all) / span
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def chirp_k(f_start, k, n, sr, out):
+    """Linear sweep from its closed-form phase 2*pi*(f_start*t + k*t**2/2)."""
+    inv_sr = 1.0 / sr
+    for i in prange(n):
+        t = i * inv_sr
+        out[i] = math.sin(TWO_PI * t * (f_start + 0.5 * k * t))
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def schumann_sum_k(weights, freqs, i0, n, sr, out):
+    """Raw weighted mode sum for samples i0 .. i0+n-1 (no rescale)."""
+    inv_sr = 1.0 / sr
+    n_blocks = (n + BLOCK - 1) // BLOCK
+    for b in prange(n_blocks):
+        start = b * BLOCK
+        _mode_sum_block(weights, freqs, i0, start, min(start + BLOCK, n), inv_sr, out)
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def schumann_range_k(weights, freqs, n, sr):
+    """(min, max) of the raw weighted mode sum over n samples, nothing stored."""
+    n_modes = freqs.shape[0]
+    lo = np.inf
+    hi = -np.inf
+    inv_sr = 1.0 / sr
+    for i in prange(n):
+        t = i * inv_sr
+        acc = 0.0
+        for m in range(n_modes):
+            acc += weights[m] * math.sin(TWO_PI * freqs[m] * t)
+        lo = min(lo, acc)
+        hi = max(hi, acc)
+    return lo, hi
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def build_iq_i8_k(weights, freqs, lo, span, gate_starts, gate_ends, i0, n, sr, out):
+    """
+    Gated Schumann envelope for samples i0 .. i0+n-1 straight to int8 IQ:
+    I = 0.99*127 * (sum - lo)/span while the gate is on, Q = 0.
+    """
+    n_modes = freqs.shape[0]
+    n_gates = gate_starts.shape[0]
+    inv_sr = 1.0 / sr
+    for i in prange(n):
+        k = i0 + i
+        on = False
+        for g in range(n_gates):
+            if gate_starts[g] <= k and k < gate_ends[g]:
+                on = True
+        s = 0.0
+        if on:
+            t = k * inv_sr
+            acc = 0.0
+            for m in range(n_modes):
+                acc += weights[m] * math.sin(TWO_PI * freqs[m] * t)
+            s = (acc - lo) / span
+        out[2 * i] = np.int8(s * (0.99 * 127))
+        out[2 * i + 1] = 0
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def breathing_k(rate, n, sr, out):
+    """out[i] = (0.5*(1 + sin(2*pi*rate*t)))**2."""
+    w = TWO_PI * rate
+    inv_sr = 1.0 / sr
+    for i in prange(n):
+        t = i * inv_sr
+        b = 0.5 * (1.0 + math.sin(w * t))
+        out[i] = b * b
+    return out
+
+
+@njit(cache=True)
+def prime_gate_k(n_samples, sr, primes, gate):
+    """Fill a zeroed gate: on for primes[0] s, off for primes[1] s, ..."""
+    t_sec = 0  # whole seconds — primes are integers, so no rounding drift
+    on = 1
+    for idx in range(primes.shape[0]):
+        start = np.int64(t_sec * sr)
+        if start >= n_samples:
+            break
+        p = primes[idx]
+        end = min(np.int64((t_sec + p) * sr), n_samples)
+        if on:
+            for k in range(start, end):
+                gate[k] = 1.0
+        t_sec += p
+        on ^= 1
+    return gate
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def normalise_k(sig, peak, out):
+    """out = sig scaled so that max|sig| == peak (unchanged if all zero)."""
+    n = sig.shape[0]
+    m = 0.0
+    for i in prange(n):
+        m = max(m, abs(sig[i]))
+    scale = peak / m if m > 0 else 1.0
+    for i in prange(n):
+        out[i] = sig[i] * scale
+    return out
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def pcm16_k(sig, peak, out):
+    """out = int16 PCM of sig normalised to peak, scaled and cast in one pass."""
+    n = sig.shape[0]
+    m = 0.0
+    for i in prange(n):
+        m = max(m, abs(sig[i]))
+    scale = peak * 32767 / m if m > 0 else 32767.0
+    for i in prange(n):
+        out[i] = np.int16(sig[i] * scale)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def pack_iq_k(i_sig, q_sig, out):
+    """Peak-normalise I and Q to 0.99 and interleave as int8 into out."""
+    n = i_sig.shape[0]
+    max_i = 0.0
+    max_q = 0.0
+    for k in prange(n):
+        max_i = max(max_i, abs(i_sig[k]))
+        max_q = max(max_q, abs(q_sig[k]))
+    scale_i = 0.99 * 127 / max_i if max_i > 0 else 127.0
+    scale_q = 0.99 * 127 / max_q if max_q > 0 else 127.0
+    for k in prange(n):
+        out[2 * k] = np.int8(i_sig[k] * scale_i)
+        out[2 * k + 1] = np.int8(q_sig[k] * scale_q)
+    return out
@@ -3,14 +3,75 @@ Mechanical Channel — Ground-coupled seismic transduction.
 Generates low-frequency WAV files for playback through DAC → amplifier → bass shaker.
 """
 
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from scipy.io import wavfile
 from .constants import AUDIO_SAMPLE_RATE, SCHUMANN_FREQUENCIES
 from .waveforms import (
-    schumann_envelope, prime_pulse_gate, chirp,
-    breathing_envelope, sine, normalise, to_int16
+    schumann_envelope, schumann_sum, prime_pulse_gate, chirp,
+    breathing_envelope, sine, normalise, to_int16, HAVE_NUMBA
 )
 
+# Worker threads for building full-programme segments (NumPy path only)
+SEGMENT_WORKERS = min(7, os.cpu_count() or 1)
+
+# Write buffer for streamed WAV output
+WAV_BUFFER_BYTES = 1024 * 1024
+
+
+class StreamingWavWriter:
+    """
+    Mono 16-bit PCM WAV writer that takes samples block by block.
+    
+    The header goes out with zero sizes and is patched on close, so the
+    whole signal never has to be held in memory:
+    
+        with StreamingWavWriter("out.wav", 44100) as wav:
+            for block in blocks:
+                wav.write(block)
+    """
+    
+    def __init__(self, filename, sample_rate):
+        self.filename = filename
+        self.sr = int(sample_rate)
+        self.n_bytes = 0
+        self._f = None
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def open(self):
+        """Create the file and write the placeholder RIFF/fmt/data header."""
+        self._f = open(self.filename, 'wb', buffering=WAV_BUFFER_BYTES)
+        self._f.write(b'RIFF' + struct.pack('<I', 0) + b'WAVE')
+        self._f.write(b'fmt ' + struct.pack('<IHHIIHH', 16, 1, 1, self.sr,
+                                            self.sr * 2, 2, 16))
+        self._f.write(b'data' + struct.pack('<I', 0))
+        self.n_bytes = 0
+    
+    def write(self, block):
+        """Append a block of int16 samples."""
+        if block.dtype != np.int16:
+            raise TypeError(f"Expected int16 samples, got {block.dtype}")
+        self._f.write(np.ascontiguousarray(block))
+        self.n_bytes += block.nbytes
+    
+    def close(self):
+        """Patch the RIFF and data chunk sizes, then close the file."""
+        if self._f is None:
+            return
+        self._f.seek(4)
+        self._f.write(struct.pack('<I', 36 + self.n_bytes))
+        self._f.seek(40)
+        self._f.write(struct.pack('<I', self.n_bytes))
+        self._f.close()
+        self._f = None
+
 
 class MechanicalChannel:
     """
@@ -20,48 +81,51 @@ class MechanicalChannel:
     through a bass shaker bolted to a ground plate.
     
     Signal path: Pi I2S → DAC → Amplifier → Bass Shaker → Ground Plate → Earth
+    
+    Waveforms are held as float32 (dtype): the output is 16-bit PCM, so
+    float64 storage only doubles the memory traffic.
     """
     
-    def __init__(self, sample_rate=AUDIO_SAMPLE_RATE):
+    def __init__(self, sample_rate=AUDIO_SAMPLE_RATE, dtype=np.float32):
         self.sr = sample_rate
+        self.dtype = dtype
     
     def schumann_fundamental(self, duration):
         """7.83 Hz — Earth's fundamental resonance."""
-        return sine(7.83, duration, self.sr)
+        return sine(7.83, duration, self.sr, self.dtype)
     
     def schumann_second(self, duration):
         """14.3 Hz — Second Schumann harmonic."""
-        return sine(14.3, duration, self.sr)
+        return sine(14.3, duration, self.sr, self.dtype)
     
     def schumann_combined(self, duration):
         """All five Schumann modes, weighted by amplitude."""
-        signal = np.zeros(int(self.sr * duration))
-        weights = [1.0, 0.7, 0.5, 0.3, 0.2]
-        for freq, weight in zip(SCHUMANN_FREQUENCIES, weights):
-            signal += weight * sine(freq, duration, self.sr)
-        return normalise(signal)
+        return normalise(schumann_sum(duration, sr=self.sr, dtype=self.dtype))
     
     def infrasound_chirp(self, duration, f_start=1.0, f_end=20.0):
         """Sweep through infrasound range."""
-        return chirp(f_start, f_end, duration, self.sr)
+        return chirp(f_start, f_end, duration, self.sr, self.dtype)
     
     def schumann_scan(self, duration):
         """Step through each Schumann mode sequentially."""
         segment_dur = duration / len(SCHUMANN_FREQUENCIES)
-        segments = [sine(f, segment_dur, self.sr) for f in SCHUMANN_FREQUENCIES]
+        segments = [sine(f, segment_dur, self.sr, self.dtype)
+                    for f in SCHUMANN_FREQUENCIES]
         return normalise(np.concatenate(segments))
     
     def breathing_schumann(self, duration):
         """Schumann fundamental with breathing amplitude envelope."""
-        carrier = sine(7.83, duration, self.sr)
-        envelope = breathing_envelope(duration, breath_rate=0.25, sr=self.sr)
-        return carrier * envelope
+        carrier = sine(7.83, duration, self.sr, self.dtype)
+        envelope = breathing_envelope(duration, breath_rate=0.25, sr=self.sr,
+                                      dtype=self.dtype)
+        carrier *= envelope
+        return carrier
     
     def pulsed_schumann(self, duration):
         """Schumann combined with prime-number pulse gating."""
         signal = self.schumann_combined(duration)
-        gate = prime_pulse_gate(duration, self.sr)
-        return signal * gate
+        signal *= prime_pulse_gate(duration, self.sr, self.dtype)
+        return signal
     
     def generate(self, programme="full", duration=3600):
         """
@@ -100,23 +164,48 @@ class MechanicalChannel:
           5:00–8:00  Pulsed combined (prime timing)
           8:00–10:00 Combined (all modes, sustained)
         """
-        segments = [
-            self.schumann_fundamental(30),
-            self.schumann_second(30),
-            self.schumann_combined(60),
-            self.infrasound_chirp(60),
-            self.breathing_schumann(120),
-            self.pulsed_schumann(180),
-            self.schumann_combined(120),
+        cycle = self._full_cycle()
+        return np.resize(cycle, int(self.sr * duration))
+    
+    def _full_cycle(self):
+        """One 10-minute cycle of the full programme (not normalised)."""
+        plan = [
+            (self.schumann_fundamental, 30),
+            (self.schumann_second, 30),
+            (self.schumann_combined, 60),
+            (self.infrasound_chirp, 60),
+            (self.breathing_schumann, 120),
+            (self.pulsed_schumann, 180),
+            (self.schumann_combined, 120),
         ]
-        cycle = np.concatenate(segments)
-        cycle_dur = len(cycle) / self.sr
-        repeats = int(np.ceil(duration / cycle_dur))
-        full = np.tile(cycle, repeats)
-        return full[:int(self.sr * duration)]
+        if HAVE_NUMBA or SEGMENT_WORKERS < 2:
+            # The numba kernels already use every core
+            return np.concatenate([gen(d) for gen, d in plan])
+        # NumPy's ufuncs release the GIL, so the segments build in parallel
+        with ThreadPoolExecutor(max_workers=SEGMENT_WORKERS) as ex:
+            futures = [ex.submit(gen, d) for gen, d in plan]
+            return np.concatenate([f.result() for f in futures])
     
     def save_wav(self, filename, programme="full", duration=3600):
-        """Generate and save as WAV file."""
-        signal = self.generate(programme, duration)
-        wavfile.write(filename, self.sr, to_int16(signal))
+        """
+        Generate and save as WAV file.
+        
+        The full programme is written as one int16 cycle repeated, rather
+        than generating and holding the whole duration in memory.
+        """
+        if programme == 'full':
+            n = int(self.sr * duration)
+            cycle = self._full_cycle()
+            if n < len(cycle):
+                blocks = [to_int16(normalise(cycle[:n]))]
+            else:
+                # Every full cycle is present, so its peak is the programme's
+                block = to_int16(normalise(cycle))
+                repeats, tail = divmod(n, len(block))
+                blocks = [block] * repeats + [block[:tail]]
+        else:
+            blocks = [to_int16(self.generate(programme, duration))]
+        with StreamingWavWriter(filename, self.sr) as wav:
+            for block in blocks:
+                wav.write(block)
         return filename
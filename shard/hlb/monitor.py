@@ -3,14 +3,126 @@ Monitor — Passive listening and anomaly detection.
 Uses RTL-SDR or HackRF in receive mode to monitor for responses.
 """
 
+import asyncio
 import numpy as np
 import subprocess
 import threading
 import time
-import json
 import os
+import queue
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime
+from scipy.signal import welch
 from .constants import HYDROGEN_LINE_HZ, WATER_HOLE_LOW, WATER_HOLE_HIGH
+from . import _jsonio
+
+try:
+    from . import _monitor_numba as _nb
+except ImportError:  # numba is optional — fall back to NumPy
+    _nb = None
+
+try:
+    from rtlsdr import RtlSdr
+except ImportError:  # pyrtlsdr is optional — streaming mode unavailable
+    RtlSdr = None
+
+# Event log batching: flush after this many events or this many seconds
+LOG_FLUSH_EVENTS = 64
+LOG_FLUSH_SECONDS = 1.0
+LOG_BUFFER_BYTES = 64 * 1024
+# rtl_power gets this long per scan; one line of its output may be this big
+SCAN_TIMEOUT = 30
+SCAN_LINE_LIMIT = 1024 * 1024
+
+
+def _align_bins(grid, freqs):
+    """Map freqs onto a sorted grid; returns (positions, exact-match mask)."""
+    pos = np.searchsorted(grid, freqs)
+    pos = np.minimum(pos, len(grid) - 1)
+    return pos, grid[pos] == freqs
+
+
+def _parse_power_line(line):
+    """One rtl_power CSV row → (freqs, powers), or None if it is too short."""
+    # Power cells start after the 6th comma; parse them in C
+    idx = -1
+    for _ in range(6):
+        idx = line.find(',', idx + 1)
+        if idx < 0:
+            return None
+    head = line[:idx].split(',')
+    freq_start = float(head[2])
+    freq_step = float(head[4])
+    powers = np.fromstring(line[idx + 1:].strip().rstrip(','), sep=',')
+    return freq_start + np.arange(powers.size) * freq_step, powers
+
+
+def _welford_update(count, mean, m2, idx, x):
+    """Fold one scan into the running per-bin count / mean / M2 arrays."""
+    if _nb is not None:
+        _nb.welford_update_k(count, mean, m2, idx, x)
+        return
+    if idx.size == 0:
+        return
+    # Overlapping hops can map several samples to one bin, and fancy-index
+    # += keeps only the last of them. Fold the k-th sample of every bin in
+    # round k, so each bin sees its samples in scan order, as in the kernel.
+    order = np.argsort(idx, kind='stable')
+    sorted_idx = idx[order]
+    pos = np.arange(idx.size)
+    first = np.r_[True, sorted_idx[1:] != sorted_idx[:-1]]
+    rank = pos - np.maximum.accumulate(np.where(first, pos, 0))
+    for r in range(rank.max() + 1):
+        sel = order[rank == r]
+        b, v = idx[sel], x[sel]
+        count[b] += 1
+        delta = v - mean[b]
+        mean[b] += delta / count[b]
+        m2[b] += delta * (v - mean[b])
+
+
+class PowerScan(Mapping):
+    """
+    One rtl_power sweep held as aligned frequency / power arrays.
+    
+    Also behaves as a read-only {frequency_hz: power_db} mapping; the
+    dict behind that view is only built on first use (see as_dict).
+    """
+    
+    def __init__(self, freqs=None, powers=None):
+        self.freqs = np.empty(0) if freqs is None else freqs
+        self.powers = np.empty(0) if powers is None else powers
+        self._dict = None
+    
+    def as_dict(self):
+        """Return the sweep as a {frequency_hz: power_db} dict."""
+        if self._dict is None:
+            self._dict = dict(zip(self.freqs.tolist(), self.powers.tolist()))
+        return self._dict
+    
+    def deduplicated(self):
+        """
+        This sweep with ascending, unique bins. Where overlapping hops repeat
+        a frequency the last power wins, as in the as_dict view.
+        """
+        if np.all(self.freqs[1:] > self.freqs[:-1]):
+            return self
+        # First occurrence in the reversed sweep is the last one in the sweep
+        freqs, idx = np.unique(self.freqs[::-1], return_index=True)
+        return PowerScan(freqs, self.powers[::-1][idx])
+    
+    def __getitem__(self, freq):
+        return self.as_dict()[freq]
+    
+    def __iter__(self):
+        return iter(self.as_dict())
+    
+    def __len__(self):
+        return len(self.as_dict())
+    
+    def __bool__(self):
+        return len(self.freqs) > 0
 
 
 class Monitor:
@@ -24,14 +136,43 @@ class Monitor:
         - JSON event logging with timestamps
     
     Signal path: Antenna → RTL-SDR (USB) → Pi → Analysis
+    
+    With stream=True (requires pyrtlsdr) one RTL-SDR handle is held open and
+    PSDs of the band around center_freq are computed in-process, so scans
+    no longer spawn rtl_power.
     """
     
-    def __init__(self, log_dir="./hlb_logs"):
+    def __init__(self, log_dir="./hlb_logs", stream=False,
+                 center_freq=HYDROGEN_LINE_HZ, sample_rate=2_400_000):
         self.log_dir = log_dir
         self.baseline = None
+        # Baseline as aligned arrays on a sorted frequency grid
+        self._freqs = None
+        self._bl_mean = None
+        self._bl_std = None
         self.running = False
         self._thread = None
+        # Continuous monitoring: event loop in self._thread, woken by _stop_async
+        self._loop = None
+        self._stop_async = None
+        # Streaming state: IQ blocks → ring (drop-oldest) → latest PSD
+        self._sdr = None
+        self._ring = deque(maxlen=8)
+        self._ring_ready = threading.Event()
+        self._latest_scan = None
+        self._stream_threads = []
+        # Event log: one buffered handle per day, optionally fed by a writer thread
+        self._log_fh = None
+        self._log_date = None
+        self._log_pending = 0
+        self._log_flushed_at = time.monotonic()
+        self._log_queue = None
+        self._writer = None
+        self._log_lock = threading.RLock()
+        self._flush_timer = None
         os.makedirs(log_dir, exist_ok=True)
+        if stream:
+            self.start_stream(center_freq, sample_rate)
     
     @staticmethod
     def is_available():
@@ -47,47 +188,197 @@ class Monitor:
     def power_scan(self, freq_start=None, freq_end=None, bin_size=1000):
         """
         Single power spectrum scan using rtl_power.
+        While streaming, returns the latest in-process PSD instead.
         
-        Returns dict of {frequency_hz: power_db}.
+        Returns a PowerScan (arrays, usable as {frequency_hz: power_db}).
         """
-        if freq_start is None:
-            freq_start = int(WATER_HOLE_LOW)
-        if freq_end is None:
-            freq_end = int(WATER_HOLE_HIGH)
+        if self._sdr is not None:
+            return self._latest_scan or PowerScan()
         
         outfile = os.path.join(self.log_dir, "scan_tmp.csv")
         
         try:
-            subprocess.run([
-                "rtl_power",
-                "-f", f"{freq_start}:{freq_end}:{bin_size}",
-                "-1",  # single scan
-                "-g", "40",
-                outfile
-            ], capture_output=True, timeout=30)
+            subprocess.run(
+                self._rtl_power_args(freq_start, freq_end, bin_size, outfile),
+                capture_output=True, timeout=SCAN_TIMEOUT,
+            )
             
             return self._parse_power_csv(outfile)
         except (FileNotFoundError, subprocess.TimeoutExpired):
-            return {}
+            return PowerScan()
+    
+    async def power_scan_async(self, freq_start=None, freq_end=None, bin_size=1000):
+        """
+        power_scan for the event loop: rtl_power writes to a pipe and each
+        CSV row is parsed as it arrives, with no temp file.
+        """
+        if self._sdr is not None:
+            return self._latest_scan or PowerScan()
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._rtl_power_args(freq_start, freq_end, bin_size, "-"),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=SCAN_LINE_LIMIT,
+            )
+        except FileNotFoundError:
+            return PowerScan()
+        
+        freqs = []
+        powers = []
+        
+        async def _read_rows():
+            async for line in proc.stdout:
+                row = _parse_power_line(line.decode())
+                if row is not None:
+                    freqs.append(row[0])
+                    powers.append(row[1])
+            await proc.wait()
+        
+        try:
+            await asyncio.wait_for(_read_rows(), timeout=SCAN_TIMEOUT)
+        except (asyncio.TimeoutError, ValueError):
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            return PowerScan()
+        
+        if not freqs:
+            return PowerScan()
+        return PowerScan(np.concatenate(freqs), np.concatenate(powers))
+    
+    @staticmethod
+    def _rtl_power_args(freq_start, freq_end, bin_size, outfile):
+        """rtl_power command line for a single scan ("-" writes to stdout)."""
+        if freq_start is None:
+            freq_start = int(WATER_HOLE_LOW)
+        if freq_end is None:
+            freq_end = int(WATER_HOLE_HIGH)
+        return [
+            "rtl_power",
+            "-f", f"{freq_start}:{freq_end}:{bin_size}",
+            "-1",  # single scan
+            "-g", "40",
+            outfile,
+        ]
+    
+    def start_stream(self, center_freq=HYDROGEN_LINE_HZ, sample_rate=2_400_000,
+                     fft_size=1024, block_size=256 * 1024):
+        """
+        Open a persistent RTL-SDR stream and start the reader / PSD threads.
+        Returns True if streaming, False if pyrtlsdr or the device is missing.
+        """
+        if self._sdr is not None:
+            return True
+        if RtlSdr is None:
+            return False
+        try:
+            sdr = RtlSdr()
+        except IOError:
+            return False
+        sdr.sample_rate = sample_rate
+        sdr.center_freq = center_freq
+        sdr.gain = 40
+        self._sdr = sdr
+        
+        reader = threading.Thread(
+            target=sdr.read_samples_async,
+            args=(self._on_samples, block_size),
+            daemon=True,
+        )
+        psd = threading.Thread(
+            target=self._psd_loop,
+            args=(center_freq, sample_rate, fft_size),
+            daemon=True,
+        )
+        self._stream_threads = [reader, psd]
+        for t in self._stream_threads:
+            t.start()
+        return True
+    
+    def stop_stream(self):
+        """Stop streaming and release the RTL-SDR."""
+        sdr = self._sdr
+        if sdr is None:
+            return
+        self._sdr = None
+        sdr.cancel_read_async()
+        self._ring_ready.set()
+        for t in self._stream_threads:
+            t.join(timeout=5)
+        self._stream_threads = []
+        sdr.close()
+        self._ring.clear()
+        self._latest_scan = None
+    
+    def _on_samples(self, samples, context):
+        """Reader callback: push the IQ block, dropping the oldest if full."""
+        self._ring.append(samples)
+        self._ring_ready.set()
+    
+    def _psd_loop(self, center_freq, sample_rate, fft_size):
+        """Turn the newest IQ block into a PowerScan, publishing it atomically."""
+        while self._sdr is not None:
+            if not self._ring_ready.wait(timeout=1.0):
+                continue
+            self._ring_ready.clear()
+            try:
+                block = self._ring.pop()
+            except IndexError:
+                continue
+            self._ring.clear()
+            
+            f, psd = welch(block, fs=sample_rate, nperseg=fft_size,
+                           return_onesided=False)
+            freqs = center_freq + np.fft.fftshift(f)
+            powers = 10 * np.log10(np.maximum(np.fft.fftshift(psd), 1e-20))
+            self._latest_scan = PowerScan(freqs, powers)
     
     def _parse_power_csv(self, filename):
-        """Parse rtl_power CSV output into frequency:power dict."""
-        results = {}
+        """
+        Parse rtl_power CSV output into a PowerScan.
+        
+        Each row is: date, time, Hz low, Hz high, Hz step, samples, dB, dB, ...
+        """
+        try:
+            with open(filename, 'r') as f:
+                lines = [line for line in f if line.strip()]
+        except IOError:
+            return PowerScan()
+        # The bulk parse needs one row width; ragged sweeps go line by line
+        widths = {line.count(',') for line in lines}
+        if len(widths) != 1 or widths.pop() < 6:
+            return self._parse_power_csv_lines(filename)
+        try:
+            data = np.loadtxt(lines, delimiter=',',
+                              usecols=range(2, lines[0].count(',') + 1), ndmin=2)
+        except ValueError:
+            # Malformed cells — fall back to per-line parsing
+            return self._parse_power_csv_lines(filename)
+        
+        starts = data[:, 0]
+        steps = data[:, 2]
+        powers = data[:, 4:]
+        freqs = starts[:, None] + np.arange(powers.shape[1]) * steps[:, None]
+        return PowerScan(freqs.ravel(), powers.ravel())
+    
+    def _parse_power_csv_lines(self, filename):
+        """Line-by-line rtl_power parser, tolerant of ragged rows."""
+        freqs = []
+        powers = []
         try:
             with open(filename, 'r') as f:
                 for line in f:
-                    parts = line.strip().split(',')
-                    if len(parts) < 7:
-                        continue
-                    freq_start = float(parts[2])
-                    freq_step = float(parts[4])
-                    powers = [float(p) for p in parts[6:] if p.strip()]
-                    for i, power in enumerate(powers):
-                        freq = freq_start + i * freq_step
-                        results[freq] = power
+                    row = _parse_power_line(line)
+                    if row is not None:
+                        freqs.append(row[0])
+                        powers.append(row[1])
         except (IOError, ValueError):
             pass
-        return results
+        if not freqs:
+            return PowerScan()
+        return PowerScan(np.concatenate(freqs), np.concatenate(powers))
     
     def capture_baseline(self, samples=5):
         """
@@ -95,34 +386,47 @@ class Monitor:
         Run this BEFORE transmitting to establish normal conditions.
         """
         print(f"  Capturing baseline ({samples} samples)...")
-        all_scans = []
+        grid = None
         for i in range(samples):
-            scan = self.power_scan()
+            scan = self.power_scan().deduplicated()
             if scan:
-                all_scans.append(scan)
+                if grid is None:
+                    # First scan fixes the frequency grid
+                    grid = scan.freqs
+                    count = np.zeros(len(grid))
+                    mean = np.zeros(len(grid))
+                    m2 = np.zeros(len(grid))
+                    all_bins = np.arange(len(grid))
+                if np.array_equal(scan.freqs, grid):
+                    # rtl_power repeats the same bin grid every sweep
+                    _welford_update(count, mean, m2, all_bins, scan.powers)
+                else:
+                    pos, matched = _align_bins(grid, scan.freqs)
+                    _welford_update(count, mean, m2, pos[matched], scan.powers[matched])
             time.sleep(2)
         
-        if not all_scans:
+        if grid is None:
             print("  Warning: No baseline data captured (is RTL-SDR connected?)")
             return
         
-        # Average power at each frequency
-        all_freqs = set()
-        for scan in all_scans:
-            all_freqs.update(scan.keys())
-        
-        self.baseline = {}
-        for freq in all_freqs:
-            powers = [s.get(freq, -100) for s in all_scans if freq in s]
-            self.baseline[freq] = {
-                'mean': np.mean(powers),
-                'std': np.std(powers),
-            }
+        # Population std, as np.std over the captured scans
+        std = np.sqrt(m2 / count)
+        self._freqs = grid
+        self._bl_mean = mean.astype(np.float32)
+        self._bl_std = std.astype(np.float32)
+        self.baseline = {
+            freq: {'mean': m, 'std': sd}
+            for freq, m, sd in zip(grid.tolist(), mean.tolist(), std.tolist())
+        }
         
         # Save baseline
         baseline_file = os.path.join(self.log_dir, "baseline.json")
-        with open(baseline_file, 'w') as f:
-            json.dump({str(k): v for k, v in self.baseline.items()}, f)
+        with open(baseline_file, 'wb') as f:
+            f.write(_jsonio.dumps_line({
+                'freqs': self._freqs,
+                'mean': self._bl_mean,
+                'std': self._bl_std,
+            }))
         
         print(f"  Baseline captured: {len(self.baseline)} frequency bins")
     
@@ -131,84 +435,224 @@ class Monitor:
         Compare current scan to baseline.
         Returns list of anomalous frequencies with details.
         """
-        if self.baseline is None:
+        if self._freqs is None:
             return []
+        return self._compare_to_baseline(self.power_scan(), threshold_sigma)
+    
+    def _compare_to_baseline(self, current, threshold_sigma):
+        """Anomalous bins of one PowerScan against the captured baseline."""
+        if self._freqs is None or not current:
+            return []
+        
+        current = current.deduplicated()
+        pos, matched = _align_bins(self._freqs, current.freqs)
+        bl_mean = self._bl_mean[pos]
+        bl_std = self._bl_std[pos]
+        
+        sigma = (current.powers - bl_mean) / np.where(bl_std > 0, bl_std, np.inf)
+        hits = np.flatnonzero(matched & (np.abs(sigma) > threshold_sigma))
         
-        current = self.power_scan()
-        anomalies = []
-        
-        for freq, power in current.items():
-            if freq in self.baseline:
-                bl = self.baseline[freq]
-                if bl['std'] > 0:
-                    sigma = (power - bl['mean']) / bl['std']
-                    if abs(sigma) > threshold_sigma:
-                        anomalies.append({
-                            'frequency_hz': freq,
-                            'power_db': power,
-                            'baseline_mean': bl['mean'],
-                            'baseline_std': bl['std'],
-                            'sigma': sigma,
-                            'timestamp': datetime.utcnow().isoformat(),
-                        })
-        
-        return anomalies
+        timestamp = datetime.utcnow().isoformat()
+        return [
+            {
+                'frequency_hz': freq,
+                'power_db': power,
+                'baseline_mean': mean,
+                'baseline_std': std,
+                'sigma': sig,
+                'timestamp': timestamp,
+            }
+            for freq, power, mean, std, sig in zip(
+                current.freqs[hits].tolist(),
+                current.powers[hits].tolist(),
+                bl_mean[hits].tolist(),
+                bl_std[hits].tolist(),
+                sigma[hits].tolist(),
+            )
+        ]
     
     def log_event(self, event_type, data):
         """Log an event to the JSON event log."""
+        now = datetime.utcnow()
         event = {
             'type': event_type,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now.isoformat(),
             'data': data,
         }
         
-        log_file = os.path.join(
-            self.log_dir,
-            f"events_{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
-        )
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        item = (now.strftime('%Y%m%d'), event)
+        log_queue = self._log_queue
+        if log_queue is not None:
+            log_queue.put(item)
+        else:
+            self._write_event(*item)
         
         return event
     
+    def _write_event(self, date, event):
+        """Append one event to the day's log, flushing in batches."""
+        with self._log_lock:
+            if date != self._log_date:
+                self._close_log()
+                log_file = os.path.join(self.log_dir, f"events_{date}.jsonl")
+                self._log_fh = open(log_file, 'ab', buffering=LOG_BUFFER_BYTES)
+                self._log_date = date
+            
+            self._log_fh.write(_jsonio.dumps_line(event))
+            self._log_pending += 1
+            if (self._log_pending >= LOG_FLUSH_EVENTS
+                    or time.monotonic() - self._log_flushed_at >= LOG_FLUSH_SECONDS):
+                self._flush_log()
+            elif self._flush_timer is None:
+                # The tail of a burst reaches disk within LOG_FLUSH_SECONDS
+                # even if no further event arrives to trigger the flush
+                self._flush_timer = threading.Timer(LOG_FLUSH_SECONDS,
+                                                    self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _timed_flush(self):
+        """Flush timer body, armed by _write_event."""
+        with self._log_lock:
+            self._flush_timer = None
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Push buffered events to disk."""
+        with self._log_lock:
+            if self._log_fh is not None and self._log_pending:
+                self._log_fh.flush()
+            self._log_pending = 0
+            self._log_flushed_at = time.monotonic()
+    
+    def _close_log(self):
+        """Flush and close the current day's log handle."""
+        with self._log_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._log_fh is not None:
+                self._log_fh.close()
+            self._log_fh = None
+            self._log_date = None
+            self._log_pending = 0
+    
+    def _writer_loop(self, log_queue):
+        """Drain queued events to disk; flush at least every LOG_FLUSH_SECONDS."""
+        while True:
+            try:
+                item = log_queue.get(timeout=LOG_FLUSH_SECONDS)
+            except queue.Empty:
+                self._flush_log()
+                continue
+            if item is None:
+                break
+            self._write_event(*item)
+        self._flush_log()
+    
     def start_continuous(self, interval=30, threshold_sigma=3.0):
         """
-        Start continuous monitoring in background thread.
-        Logs anomalies automatically.
+        Start continuous monitoring on an asyncio loop in a background thread.
+        Logs anomalies automatically, via a single event-writer thread.
         """
+        if self._thread is not None:
+            return
         self.running = True
         
-        def _monitor_loop():
-            while self.running:
-                anomalies = self.detect_anomalies(threshold_sigma)
-                if anomalies:
-                    for a in anomalies:
-                        self.log_event('anomaly', a)
-                        print(f"  ⚠ ANOMALY: {a['frequency_hz']/1e6:.3f} MHz, "
-                              f"{a['sigma']:.1f}σ above baseline")
-                time.sleep(interval)
-        
-        self._thread = threading.Thread(target=_monitor_loop, daemon=True)
+        if self._writer is None:
+            self._log_queue = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(self._log_queue,), daemon=True
+            )
+            self._writer.start()
+        
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            args=(self._loop, self._monitor_loop(interval, threshold_sigma)),
+            daemon=True,
+        )
         self._thread.start()
     
+    @staticmethod
+    def _run_loop(loop, coro):
+        """Thread body: run coro to completion on its own event loop."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    
+    async def _monitor_loop(self, interval, threshold_sigma):
+        """Scan, compare against the baseline, log anomalies, wait; until stopped."""
+        stop = self._stop_async = asyncio.Event()
+        while self.running:
+            if self._freqs is not None:
+                scan = await self.power_scan_async()
+                for a in self._compare_to_baseline(scan, threshold_sigma):
+                    self.log_event('anomaly', a)
+                    print(f"  ⚠ ANOMALY: {a['frequency_hz']/1e6:.3f} MHz, "
+                          f"{a['sigma']:.1f}σ above baseline")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _wake_monitor(self):
+        """Runs on the monitor loop: interrupt the wait between scans."""
+        if self._stop_async is not None:
+            self._stop_async.set()
+    
     def stop_continuous(self):
-        """Stop continuous monitoring."""
+        """Stop continuous monitoring and flush pending events."""
         self.running = False
         if self._thread:
+            try:
+                self._loop.call_soon_threadsafe(self._wake_monitor)
+            except RuntimeError:  # loop already closed
+                pass
             self._thread.join(timeout=5)
             self._thread = None
+            self._loop = None
+            self._stop_async = None
+        
+        log_queue = self._log_queue
+        if self._writer:
+            self._log_queue = None
+            log_queue.put(None)
+            self._writer.join(timeout=5)
+            self._writer = None
+            # Anything queued after the stop marker
+            while True:
+                try:
+                    item = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self._write_event(*item)
+        self._flush_log()
+    
+    def close(self):
+        """Stop monitoring and streaming, and close the event log."""
+        self.stop_continuous()
+        self.stop_stream()
+        self._close_log()
     
     def get_events(self, date=None):
         """Read events from log file."""
         if date is None:
             date = datetime.utcnow().strftime('%Y%m%d')
         
+        with self._log_lock:
+            if date == self._log_date and self._log_fh is not None:
+                self._log_fh.flush()
+        
         log_file = os.path.join(self.log_dir, f"events_{date}.jsonl")
         events = []
         try:
-            with open(log_file, 'r') as f:
+            with open(log_file, 'rb') as f:
                 for line in f:
-                    events.append(json.loads(line))
+                    events.append(_jsonio.loads(line))
         except IOError:
             pass
         return events
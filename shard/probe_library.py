@@ -221,20 +221,12 @@ class ProbeLibrary:
     
     def _prime_sequence(self, duration: float, params: dict) -> np.ndarray:
         """Prime number interval pulsing."""
-        primes = params.get("primes", PRIMES[:15])
-        n_samples = int(self.sr * duration)
-        signal = np.zeros(n_samples)
+        primes = np.asarray(params.get("primes", PRIMES[:15]), dtype=np.float64)
         
-        t = 0
-        idx = 0
-        while t < duration and idx < len(primes):
-            p = primes[idx]
-            pulse_duration = min(0.1, p / 10.0)  # Short pulse
-            start = int(t * self.sr)
-            end = min(int((t + pulse_duration) * self.sr), n_samples)
-            signal[start:end] = 1.0
-            t += p
-            idx += 1
+        # Pulse k starts after the first k prime intervals
+        starts = np.cumsum(np.r_[0.0, primes])[:-1]
+        widths = np.minimum(0.1, primes / 10.0)  # Short pulse
+        signal = self._pulse_train(duration, starts, widths)
         
         return to_iq_int8(signal, np.zeros_like(signal))
     
@@ -249,22 +241,28 @@ class ProbeLibrary:
         
         # Normalize to fit duration
         total = sum(fib)
-        fib_scaled = [f / total * duration for f in fib]
+        fib_scaled = np.array(fib, dtype=np.float64) / total * duration
+        
+        starts = np.concatenate(([0.0], np.cumsum(fib_scaled[:-1])))
+        widths = np.minimum(0.1, fib_scaled / 2.0)
+        signal = self._pulse_train(duration, starts, widths)
         
+        return to_iq_int8(signal, np.zeros_like(signal))
+    
+    def _pulse_train(self, duration: float, starts: np.ndarray,
+                     widths: np.ndarray) -> np.ndarray:
+        """Unit pulses at start times / widths in seconds; pulses from duration on are dropped."""
         n_samples = int(self.sr * duration)
         signal = np.zeros(n_samples)
         
-        t = 0
-        for f in fib_scaled:
-            if t >= duration:
-                break
-            pulse_duration = min(0.1, f / 2.0)
-            start = int(t * self.sr)
-            end = min(int((t + pulse_duration) * self.sr), n_samples)
+        keep = starts < duration
+        first = (starts[keep] * self.sr).astype(np.int64)
+        last = np.minimum(((starts[keep] + widths[keep]) * self.sr).astype(np.int64),
+                          n_samples)
+        for start, end in zip(first.tolist(), last.tolist()):
             signal[start:end] = 1.0
-            t += f
         
-        return to_iq_int8(signal, np.zeros_like(signal))
+        return signal
     
     def _golden_ratio(self, duration: float, params: dict) -> np.ndarray:
         """Golden ratio (φ ≈ 1.618) modulated signal."""
@@ -272,7 +270,7 @@ class ProbeLibrary:
         phi_periods = params.get("phi_periods", 5)
         
         # Modulate at phi Hz, phi² Hz, etc.
-        t = np.linspace(0, duration, int(self.sr * duration), endpoint=False)
+        t = np.arange(int(self.sr * duration)) * (1.0 / self.sr)
         signal = np.zeros_like(t)
         
         for n in range(1, phi_periods + 1):